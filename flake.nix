@@ -17,6 +17,7 @@
           rich
           docker
           pydantic
+          orjson
 
           # Development dependencies
           pytest
@@ -105,6 +106,7 @@ EOF
             rich
             docker
             pydantic
+            orjson
           ];
 
           checkInputs = with pkgs.python312Packages; [
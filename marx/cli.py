@@ -1,27 +1,32 @@
 """Command-line interface for Marx."""
 
+from __future__ import annotations
+
 import os
 import re
 import shutil
 import sys
+import threading
+import uuid
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
 import click
-
-from marx.config import SUPPORTED_AGENTS, load_environment_from_file
-from marx.docker_runner import DockerRunner, ReviewPrompt
-from marx.exceptions import DependencyError, MarxError
-from marx.github import GitHubClient
-from marx.review import (
-    count_issues_by_priority,
-    merge_reviews,
-    post_github_review,
-    save_merged_review,
+import orjson
+
+from marx.config import (
+    DEFAULT_PR_LIST_LIMIT,
+    SUPPORTED_AGENTS,
+    SUPPORTED_AGENTS_DISPLAY,
+    SUPPORTED_AGENTS_TUPLE,
+    load_environment_from_file,
 )
+from marx.exceptions import DependencyError, MarxError
 from marx.ui import (
     confirm,
     console,
-    display_issue,
+    display_issue_sections,
     display_pr_table,
     display_review_summary,
     print_error,
@@ -32,22 +37,48 @@ from marx.ui import (
     prompt_for_selection,
 )
 
+if TYPE_CHECKING:
+    from marx.github import GitHubClient
 
-def check_dependencies(require_docker: bool = True) -> None:
-    """Check for required system dependencies."""
-    missing = []
+_SCRIPT_DIR: Final[Path] = Path(__file__).resolve().parent.parent
+_BRANCH_SANITIZE: Final[dict[int, str]] = str.maketrans({"/": "-"})
+_AGENTS_HELP: Final[str] = (
+    f"Comma- or space-separated list of agents to run ({SUPPORTED_AGENTS_DISPLAY}). "
+    "Append :model to override the default model (e.g., claude:opus). Default: all agents"
+)
+
+
+def find_executables(names: Iterable[str]) -> set[str]:
+    """Return the subset of ``names`` available as executables on ``PATH``."""
+    remaining = set(names)
+    found: set[str] = set()
+
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not remaining:
+            break
+        try:
+            entries = set(os.listdir(directory or os.curdir))
+        except OSError:
+            continue
+        for name in remaining & entries:
+            candidate = os.path.join(directory, name)
+            if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+                found.add(name)
+        remaining -= found
 
-    if not shutil.which("git"):
-        missing.append("git")
+    # Defer to shutil.which for anything the listing missed (e.g. PATHEXT on Windows).
+    found.update(name for name in remaining if shutil.which(name))
+    return found
 
-    if not shutil.which("gh"):
-        missing.append("gh (GitHub CLI)")
 
-    if not shutil.which("jq"):
-        missing.append("jq")
+def check_dependencies(require_docker: bool = True) -> None:
+    """Check for required system dependencies."""
+    required = {"git": "git", "gh": "gh (GitHub CLI)", "jq": "jq"}
+    if require_docker:
+        required["docker"] = "docker"
 
-    if require_docker and not shutil.which("docker"):
-        missing.append("docker")
+    available = find_executables(required)
+    missing = [label for name, label in required.items() if name not in available]
 
     if missing:
         raise DependencyError(
@@ -61,18 +92,25 @@ def parse_agent_argument(agents_str: str) -> tuple[list[str], dict[str, str]]:
 
     tokens = [token.strip() for token in re.split(r"[\s,]+", agents_str) if token.strip()]
 
+    parts = [token.partition(":") for token in tokens]
+
+    if not SUPPORTED_AGENTS.issuperset(agent_part.lower() for agent_part, _, _ in parts):
+        invalid = [
+            agent_part or token
+            for token, (agent_part, _, _) in zip(tokens, parts, strict=True)
+            if agent_part.lower() not in SUPPORTED_AGENTS
+        ]
+        raise click.BadParameter(
+            f"Invalid agent(s): {', '.join(invalid)}. "
+            f"Valid agents are: {SUPPORTED_AGENTS_DISPLAY}"
+        )
+
     selected: list[str] = []
     model_overrides: dict[str, str] = {}
-    invalid: list[str] = []
 
-    for token in tokens:
-        agent_part, has_model, model_part = token.partition(":")
+    for agent_part, has_model, model_part in parts:
         agent = agent_part.lower()
 
-        if agent not in SUPPORTED_AGENTS:
-            invalid.append(agent_part or token)
-            continue
-
         if agent not in selected:
             selected.append(agent)
 
@@ -82,26 +120,22 @@ def parse_agent_argument(agents_str: str) -> tuple[list[str], dict[str, str]]:
                 raise click.BadParameter(f"Agent '{agent_part}' is missing a model name after ':'")
             model_overrides[agent] = model
 
-    if invalid:
-        raise click.BadParameter(
-            f"Invalid agent(s): {', '.join(invalid)}. "
-            f"Valid agents are: {', '.join(sorted(SUPPORTED_AGENTS))}"
-        )
-
     if not selected:
         raise click.BadParameter("No valid agents specified")
 
     return selected, model_overrides
 
 
-def select_pr_interactive(github_client: GitHubClient) -> tuple[int, str]:
-    """Interactively select a PR from the list."""
+def select_pr_interactive(
+    github_client: GitHubClient, limit: int = DEFAULT_PR_LIST_LIMIT
+) -> tuple[int, str, str]:
+    """Interactively select a PR and return its number, branch, and head commit SHA."""
     print_header("🔍 Fetching open PRs with reviewers (excluding yours)...")
 
     current_user = github_client.get_current_user()
     print_success(f"Current user: {current_user}")
 
-    prs = github_client.list_prs()
+    prs = github_client.list_prs(limit=limit)
     filtered_prs = github_client.filter_prs_for_user(prs, current_user)
 
     if not filtered_prs:
@@ -122,7 +156,8 @@ def select_pr_interactive(github_client: GitHubClient) -> tuple[int, str]:
         requested_reviewers = github_client._extract_reviewer_logins(review_requests)
         review_authors = github_client._extract_reviewer_logins(reviews, key="author")
 
-        all_reviewers = list(set(requested_reviewers + review_authors))
+        all_reviewers = set(requested_reviewers)
+        all_reviewers.update(review_authors)
 
         pr_data.append(
             {
@@ -130,7 +165,8 @@ def select_pr_interactive(github_client: GitHubClient) -> tuple[int, str]:
                 "title": pr["title"],
                 "author": pr.get("author", {}).get("login", "unknown"),
                 "branch": pr["headRefName"],
-                "reviewers": ", ".join(all_reviewers) if all_reviewers else "None",
+                "commit_sha": pr.get("headRefOid", ""),
+                "reviewers": ", ".join(sorted(all_reviewers)) if all_reviewers else "None",
                 "additions": pr.get("additions", 0),
                 "deletions": pr.get("deletions", 0),
             }
@@ -142,33 +178,76 @@ def select_pr_interactive(github_client: GitHubClient) -> tuple[int, str]:
     selection = prompt_for_selection(len(pr_data))
     selected = pr_data[selection - 1]
 
-    return selected["number"], selected["branch"]
+    return selected["number"], selected["branch"], selected["commit_sha"]
+
+
+def remove_directory_in_background(path: Path) -> threading.Thread | None:
+    """Detach a directory from its path and delete it on a background thread.
+
+    The directory is renamed next to itself first, so ``path`` can be recreated right
+    away while the deletion overlaps with the rest of the run. The thread is not a
+    daemon, so the interpreter waits for it to finish before exiting.
+    """
+    trash = path.with_name(f".{path.name}.{uuid.uuid4().hex}.deleting")
+    try:
+        path.rename(trash)
+    except OSError:
+        shutil.rmtree(path)
+        return None
+
+    thread = threading.Thread(target=_remove_tree, args=(trash,), name=f"remove-{path.name}")
+    thread.start()
+    return thread
+
+
+def _remove_tree(path: Path) -> None:
+    """Delete a directory tree, warning about anything that could not be removed."""
+    errors: list[BaseException] = []
+    shutil.rmtree(path, onexc=lambda _func, _path, exc: errors.append(exc))
+    if errors:
+        print_warning(
+            f"Could not fully delete {path} ({len(errors)} error(s), first: {errors[0]}). "
+            "Please remove it manually."
+        )
+
+
+def write_placeholder_review(output_file: Path, pr_number: int, description: str) -> None:
+    """Write an empty "Not run" review for an agent that produced no output."""
+    placeholder = {
+        "pr_summary": {
+            "number": pr_number,
+            "title": "Not run",
+            "description": description,
+        },
+        "issues": [],
+    }
+    output_file.write_bytes(orjson.dumps(placeholder))
 
 
 def setup_run_directory(
     script_dir: Path, pr_number: int, branch_name: str, resume_mode: bool
 ) -> Path:
     """Set up the run artifacts directory."""
-    sanitized_branch = branch_name.replace("/", "-")
+    sanitized_branch = branch_name.translate(_BRANCH_SANITIZE)
     run_dir = script_dir / "runs" / f"pr-{pr_number}-{sanitized_branch}"
-    run_dir.parent.mkdir(parents=True, exist_ok=True)
+    os.makedirs(run_dir.parent, exist_ok=True)
 
     if resume_mode:
-        if not run_dir.exists():
+        if not os.path.isdir(run_dir):
             raise MarxError(
                 f"Resume mode requested but no artifacts found at {run_dir}\n"
                 "Run the agents at least once before using --resume."
             )
         print_success(f"Using existing run artifacts directory: {run_dir}")
     else:
-        if run_dir.exists():
+        if os.path.isdir(run_dir):
             if confirm(
                 f"Existing run directory detected: {run_dir}\n"
                 "Do you want to remove it and start fresh?",
                 default=False,
             ):
-                shutil.rmtree(run_dir)
-                print_success("Removed existing run directory")
+                remove_directory_in_background(run_dir)
+                print_success("Moved existing run directory aside; deleting in background")
             else:
                 print_info("Reusing existing run directory")
 
@@ -187,23 +266,27 @@ def setup_run_directory(
 @click.option(
     "--agents",
     type=str,
-    help=(
-        f"Comma- or space-separated list of agents to run ({', '.join(SUPPORTED_AGENTS)}). "
-        "Append :model to override the default model (e.g., claude:opus). Default: all agents"
-    ),
+    help=_AGENTS_HELP,
 )
 @click.option(
     "--repo",
     type=str,
     help="Repository in the format owner/repo (e.g., acmecorp/my-app)",
 )
+@click.option(
+    "--pr-limit",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PR_LIST_LIMIT,
+    show_default=True,
+    help="Maximum number of open PRs to list in interactive mode (ignored with --pr)",
+)
 @click.option(
     "--resume",
     is_flag=True,
     help="Reuse artifacts from the previous run and skip AI execution",
 )
 @click.version_option()
-def main(pr: int | None, agents: str | None, repo: str | None, resume: bool) -> None:
+def main(pr: int | None, agents: str | None, repo: str | None, pr_limit: int, resume: bool) -> None:
     """Interactive script to fetch open GitHub PRs with reviewers, create a git worktree,
     and run automated code review with multiple AI models (Claude, Codex, Gemini).
 
@@ -224,22 +307,28 @@ def main(pr: int | None, agents: str | None, repo: str | None, resume: bool) ->
       marx --agents codex,gemini                   # Interactive mode with Codex and Gemini
       marx --repo acmecorp/my-app               # Review PRs in specific repository
       marx --pr 123 --repo acmecorp/my-app      # Review specific PR in specific repository
+      marx --pr-limit 500                         # Choose from up to 500 open PRs
       marx --resume --pr 123                      # Reuse artifacts without rerunning agents
     """
+    # Deferred so that --help and --version do not pay for docker and pydantic imports.
+    from marx.docker_runner import DockerRunner, ReviewPrompt
+    from marx.github import GitHubClient
+    from marx.review import merge_reviews, post_github_review, save_merged_review
+
     try:
         load_environment_from_file()
 
         require_docker = not resume
         check_dependencies(require_docker)
 
-        agents_to_run = list(SUPPORTED_AGENTS)
+        agents_to_run = list(SUPPORTED_AGENTS_TUPLE)
         model_overrides: dict[str, str] = {}
         if agents:
             parsed_agents, model_overrides = parse_agent_argument(agents)
             agents_to_run = parsed_agents
             if resume:
                 print_warning("--agents option is ignored when --resume is used")
-                agents_to_run = list(SUPPORTED_AGENTS)
+                agents_to_run = list(SUPPORTED_AGENTS_TUPLE)
                 model_overrides = {}
 
         if model_overrides:
@@ -266,17 +355,14 @@ def main(pr: int | None, agents: str | None, repo: str | None, resume: bool) ->
             commit_sha = pr_data.get("headRefOid", "")
             print_success(f"Found PR #{pr_number} with branch: {branch_name}")
         else:
-            pr_number, branch_name = select_pr_interactive(github_client)
-            pr_data = github_client.get_pr(pr_number)
-            commit_sha = pr_data.get("headRefOid", "")
+            pr_number, branch_name, commit_sha = select_pr_interactive(github_client, pr_limit)
 
         if commit_sha:
             print_success(f"PR head commit: {commit_sha[:8]}")
         else:
             print_warning("Unable to determine the PR head commit SHA")
 
-        script_dir = Path(__file__).parent.parent
-        run_dir = setup_run_directory(script_dir, pr_number, branch_name, resume)
+        run_dir = setup_run_directory(_SCRIPT_DIR, pr_number, branch_name, resume)
 
         claude_output = run_dir / "claude-review.json"
         codex_output = run_dir / "codex-review.json"
@@ -286,31 +372,25 @@ def main(pr: int | None, agents: str | None, repo: str | None, resume: bool) ->
         if resume:
             print_header("⏩ Resume Mode: Reusing previous agent results")
 
+            with os.scandir(run_dir) as entries:
+                existing_files = {entry.name for entry in entries}
+
             for agent_name, output_file in [
                 ("claude", claude_output),
                 ("codex", codex_output),
                 ("gemini", gemini_output),
             ]:
-                if output_file.exists():
+                if output_file.name in existing_files:
                     print_info(f"Found {agent_name} review: {output_file}")
                 else:
                     print_warning(
                         f"No {agent_name} review found at {output_file}, creating placeholder"
                     )
-                    placeholder = {
-                        "pr_summary": {
-                            "number": pr_number,
-                            "title": "Not run",
-                            "description": f"{agent_name} review not found in resume mode",
-                        },
-                        "issues": [],
-                    }
-                    import json
-
-                    with open(output_file, "w") as f:
-                        json.dump(placeholder, f)
+                    write_placeholder_review(
+                        output_file, pr_number, f"{agent_name} review not found in resume mode"
+                    )
         else:
-            docker_runner = DockerRunner(script_dir)
+            docker_runner = DockerRunner(_SCRIPT_DIR)
             docker_runner.ensure_image()
 
             prompt_config = ReviewPrompt(
@@ -329,21 +409,13 @@ def main(pr: int | None, agents: str | None, repo: str | None, resume: bool) ->
                 agents_to_run, prompt_config, run_dir, model_overrides
             )
 
-            for agent_name in SUPPORTED_AGENTS:
-                output_file = run_dir / f"{agent_name}-review.json"
-                if agent_name not in agents_to_run:
-                    placeholder = {
-                        "pr_summary": {
-                            "number": pr_number,
-                            "title": "Not run",
-                            "description": f"{agent_name} was not selected",
-                        },
-                        "issues": [],
-                    }
-                    import json
-
-                    with open(output_file, "w") as f:
-                        json.dump(placeholder, f)
+            missing_agents = SUPPORTED_AGENTS - set(agents_to_run)
+            for agent_name in missing_agents:
+                write_placeholder_review(
+                    run_dir / f"{agent_name}-review.json",
+                    pr_number,
+                    f"{agent_name} was not selected",
+                )
 
         print_info("Merging results from all models...")
         merged_review = merge_reviews(claude_output, codex_output, gemini_output)
@@ -352,36 +424,25 @@ def main(pr: int | None, agents: str | None, repo: str | None, resume: bool) ->
         print_success("Merged code review completed! 📝")
         console.print()
 
-        p0_count, p1_count, p2_count = count_issues_by_priority(merged_review.issues)
+        issues_by_priority = merged_review.issues_by_priority
         total_issues = len(merged_review.issues)
 
         display_review_summary(
             merged_review.pr_summary.title,
             merged_review.descriptions,
-            p0_count,
-            p1_count,
-            p2_count,
+            len(issues_by_priority["P0"]),
+            len(issues_by_priority["P1"]),
+            len(issues_by_priority["P2"]),
             total_issues,
         )
 
-        if total_issues > 0:
-            if p0_count > 0:
-                print_header("🔴 P0 - Critical Issues")
-                for issue in merged_review.issues:
-                    if issue.priority == "P0":
-                        display_issue(issue.model_dump(), "🔴")
-
-            if p1_count > 0:
-                print_header("🟡 P1 - Important Issues")
-                for issue in merged_review.issues:
-                    if issue.priority == "P1":
-                        display_issue(issue.model_dump(), "🟡")
-
-            if p2_count > 0:
-                print_header("🔵 P2 - Suggestions")
-                for issue in merged_review.issues:
-                    if issue.priority == "P2":
-                        display_issue(issue.model_dump(), "🔵")
+        display_issue_sections(
+            [
+                ("🔴 P0 - Critical Issues", "🔴", issues_by_priority["P0"]),
+                ("🟡 P1 - Important Issues", "🟡", issues_by_priority["P1"]),
+                ("🔵 P2 - Suggestions", "🔵", issues_by_priority["P2"]),
+            ]
+        )
 
         print_info("Individual reviews saved:")
         console.print(f"  [cyan]{claude_output}[/cyan]")
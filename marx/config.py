@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 from importlib import resources
 from pathlib import Path
 from typing import Final
@@ -13,7 +14,11 @@ DOCKER_IMAGE_CONFIG_KEY: Final[str] = "DOCKER_IMAGE"
 CONTAINER_RUNNER_DIR: Final[str] = "/runner"
 CONTAINER_WORKSPACE_DIR: Final[str] = "/workspace"
 
-SUPPORTED_AGENTS: Final[set[str]] = {"claude", "codex", "gemini"}
+DEFAULT_PR_LIST_LIMIT: Final[int] = 100
+
+SUPPORTED_AGENTS_TUPLE: Final[tuple[str, ...]] = ("claude", "codex", "gemini")
+SUPPORTED_AGENTS: Final[frozenset[str]] = frozenset(SUPPORTED_AGENTS_TUPLE)
+SUPPORTED_AGENTS_DISPLAY: Final[str] = ", ".join(SUPPORTED_AGENTS_TUPLE)
 
 AGENT_COMMANDS: Final[dict[str, str]] = {
     "claude": "claude --print --output-format stream-json --verbose --dangerously-skip-permissions",
@@ -42,31 +47,22 @@ DEFAULT_PROMPT_RESOURCE_NAME: Final[str] = "review_prompt.md"
 _CONFIG_CACHE: dict[Path, dict[str, str]] = {}
 
 
-def _parse_config_line(line: str) -> tuple[str, str] | None:
-    """Parse a single configuration line into a key/value pair."""
-
-    stripped = line.strip()
-    if not stripped or stripped.startswith("#"):
-        return None
-
-    if "=" not in stripped:
-        return None
+_CONFIG_LINE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
 
-    key, value = stripped.split("=", 1)
-    key = key.strip()
-    value = value.strip()
 
-    if not key:
-        return None
+def _normalize_config_value(value: str) -> str:
+    """Strip matching quotes or a trailing inline comment from a config value."""
 
     if value and value[0] in {'"', "'"} and value[-1] == value[0]:
-        value = value[1:-1]
-    else:
-        hash_index = value.find(" #")
-        if hash_index != -1:
-            value = value[:hash_index].strip()
+        return value[1:-1]
 
-    return key, value
+    hash_index = value.find(" #")
+    if hash_index != -1:
+        return value[:hash_index].strip()
+
+    return value
 
 
 def load_config_file(path: Path | None = None) -> dict[str, str]:
@@ -77,18 +73,15 @@ def load_config_file(path: Path | None = None) -> dict[str, str]:
     if cached is not None:
         return dict(cached)
 
-    config: dict[str, str] = {}
-
     try:
-        with resolved_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                parsed = _parse_config_line(line)
-                if parsed is None:
-                    continue
-                key, value = parsed
-                config[key] = value
+        text = resolved_path.read_text(encoding="utf-8")
     except FileNotFoundError:
-        pass
+        text = ""
+
+    config = {
+        match.group(1): _normalize_config_value(match.group(2))
+        for match in _CONFIG_LINE_PATTERN.finditer(text)
+    }
 
     _CONFIG_CACHE[resolved_path] = config
     return dict(config)
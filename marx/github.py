@@ -5,7 +5,9 @@ import re
 import subprocess
 from typing import Any
 
-from marx.config import get_config_value
+import orjson
+
+from marx.config import DEFAULT_PR_LIST_LIMIT, get_config_value
 from marx.exceptions import GitHubAPIError
 
 
@@ -127,8 +129,12 @@ class GitHubClient:
                 "Could not get GitHub username. Make sure gh CLI is authenticated."
             ) from e
 
-    def list_prs(self, limit: int = 100) -> list[dict[str, Any]]:
-        """List open PRs with reviewer information."""
+    def list_prs(self, limit: int = DEFAULT_PR_LIST_LIMIT) -> list[dict[str, Any]]:
+        """List open PRs with reviewer information.
+
+        ``gh pr list`` pages through a GraphQL query 100 PRs at a time, so fetching
+        takes ceil(limit / 100) round-trips regardless of the requested fields.
+        """
         stdout, _ = self._run_gh_command(
             [
                 "pr",
@@ -138,12 +144,15 @@ class GitHubClient:
                 "--state",
                 "open",
                 "--json",
-                "number,title,headRefName,author,reviewRequests,reviews,additions,deletions",
+                (
+                    "number,title,headRefName,headRefOid,author,"
+                    "reviewRequests,reviews,additions,deletions"
+                ),
                 "--limit",
                 str(limit),
             ]
         )
-        return json.loads(stdout)  # type: ignore[no-any-return]
+        return orjson.loads(stdout)  # type: ignore[no-any-return]
 
     def filter_prs_for_user(self, prs: list[dict[str, Any]], username: str) -> list[dict[str, Any]]:
         """Filter PRs to exclude those authored by or assigned to user."""
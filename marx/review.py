@@ -1,6 +1,8 @@
 """Review processing, merging, and GitHub posting."""
 
 import json
+import warnings
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +49,23 @@ class MergedReview(BaseModel):
     pr_summary: PRSummary
     issues: list[Issue]
 
+    @property
+    def issues_by_priority(self) -> dict[str, list[Issue]]:
+        """Issues grouped by priority level, derived from ``issues`` in one pass."""
+        buckets, _ = _bucket_issues_by_priority(self.issues)
+        return buckets
+
+
+def _bucket_issues_by_priority(
+    issues: Iterable[Issue],
+) -> tuple[dict[str, list[Issue]], list[Issue]]:
+    """Group issues by known priority, returning unknown priorities separately."""
+    buckets: dict[str, list[Issue]] = {priority: [] for priority in PRIORITY_ORDER}
+    unprioritized: list[Issue] = []
+    for issue in issues:
+        buckets.get(issue.priority, unprioritized).append(issue)
+    return buckets, unprioritized
+
 
 def load_review(file_path: Path) -> AgentReview:
     """Load a review from a JSON file."""
@@ -81,11 +100,13 @@ def merge_reviews(
         title=first_review.pr_summary.title,
     )
 
-    all_issues: list[Issue] = []
-    for review in reviews.values():
-        all_issues.extend(review.issues)
+    issues_by_priority, unprioritized = _bucket_issues_by_priority(
+        issue for review in reviews.values() for issue in review.issues
+    )
 
-    all_issues.sort(key=lambda issue: PRIORITY_ORDER.get(issue.priority, 999))
+    # Concatenating the buckets in priority order is equivalent to a stable sort.
+    all_issues = [issue for bucket in issues_by_priority.values() for issue in bucket]
+    all_issues.extend(unprioritized)
 
     return MergedReview(
         descriptions=descriptions,
@@ -96,12 +117,19 @@ def merge_reviews(
 
 def save_merged_review(review: MergedReview, output_file: Path) -> None:
     """Save merged review to a JSON file."""
-    with open(output_file, "w") as f:
-        json.dump(review.model_dump(), f, indent=2)
+    output_file.write_text(json.dumps(review.model_dump(), indent=2))
 
 
 def count_issues_by_priority(issues: list[Issue]) -> tuple[int, int, int]:
-    """Count issues by priority level."""
+    """Count issues by priority level.
+
+    Deprecated: take ``len()`` of the buckets in ``MergedReview.issues_by_priority``.
+    """
+    warnings.warn(
+        "count_issues_by_priority is deprecated; use MergedReview.issues_by_priority",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     p0 = sum(1 for issue in issues if issue.priority == "P0")
     p1 = sum(1 for issue in issues if issue.priority == "P1")
     p2 = sum(1 for issue in issues if issue.priority == "P2")
@@ -138,7 +166,10 @@ def create_github_review_payload(
     commit_sha: str,
 ) -> dict[str, Any]:
     """Create a GitHub review payload with inline comments and summary."""
-    p0, p1, p2 = count_issues_by_priority(merged_review.issues)
+    issues_by_priority = merged_review.issues_by_priority
+    p0 = len(issues_by_priority["P0"])
+    p1 = len(issues_by_priority["P1"])
+    p2 = len(issues_by_priority["P2"])
     total = len(merged_review.issues)
 
     valid_positions = github_client.get_valid_inline_positions(pr_number)
@@ -243,8 +274,7 @@ def post_github_review(
         payload = create_github_review_payload(merged_review, github_client, pr_number, commit_sha)
 
         payload_file = run_path / "pending-review-request.json"
-        with open(payload_file, "w") as f:
-            json.dump(payload, f, indent=2)
+        payload_file.write_text(json.dumps(payload, indent=2))
 
         response = github_client.create_review(
             pr_number=pr_number,
@@ -1,10 +1,16 @@
 """Terminal UI and output formatting using rich."""
 
-from rich.console import Console
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from marx.review import Issue
+
 console = Console()
 
 
@@ -28,9 +34,14 @@ def print_warning(message: str) -> None:
     console.print(f"[yellow]⚠️  {message}[/yellow]")
 
 
+def render_header(message: str) -> str:
+    """Build the markup for a header message."""
+    return f"\n[bold magenta]{message}[/bold magenta]\n"
+
+
 def print_header(message: str) -> None:
     """Print a header message."""
-    console.print(f"\n[bold magenta]{message}[/bold magenta]\n")
+    console.print(render_header(message))
 
 
 def create_progress() -> Progress:
@@ -98,32 +109,36 @@ def display_review_summary(
     console.print()
 
 
-def display_issue(issue: dict, priority_emoji: str) -> None:
-    """Display a single issue."""
-    agent = issue.get("agent", "unknown").upper()
-    file_path = issue.get("file", "unknown")
-    line = issue.get("line", "?")
-    category = issue.get("category", "unspecified")
-    description = issue.get("description", "No description")
-    proposed_fix = issue.get("proposed_fix", "No fix suggested")
-
+def render_issue(issue: "Issue", priority_emoji: str) -> Panel:
+    """Build the panel for a single issue."""
     panel_content = (
-        f"🤖 Agent: [bold magenta]{agent}[/bold magenta]\n"
-        f"📁 [bold cyan]{file_path}:{line}[/bold cyan]\n"
-        f"🏷️ [bold]{category}[/bold]\n\n"
-        f"[bold]Issue:[/bold] {description}\n\n"
-        f"[bold green]💡 Fix:[/bold green] {proposed_fix}"
+        f"🤖 Agent: [bold magenta]{issue.agent.upper()}[/bold magenta]\n"
+        f"📁 [bold cyan]{issue.file}:{issue.line}[/bold cyan]\n"
+        f"🏷️ [bold]{issue.category}[/bold]\n\n"
+        f"[bold]Issue:[/bold] {issue.description}\n\n"
+        f"[bold green]💡 Fix:[/bold green] {issue.proposed_fix}"
     )
 
-    console.print(
-        Panel(
-            panel_content,
-            border_style="dim",
-            padding=(0, 1),
-        )
+    return Panel(
+        panel_content,
+        border_style="dim",
+        padding=(0, 1),
     )
 
 
+def display_issue_sections(sections: Iterable[tuple[str, str, list["Issue"]]]) -> None:
+    """Display titled issue sections in a single console write."""
+    renderables: list[RenderableType] = []
+    for title, priority_emoji, issues in sections:
+        if not issues:
+            continue
+        renderables.append(render_header(title))
+        renderables.extend(render_issue(issue, priority_emoji) for issue in issues)
+
+    if renderables:
+        console.print(Group(*renderables))
+
+
 def confirm(prompt: str, default: bool = False) -> bool:
     """Ask for user confirmation."""
     default_str = "Y/n" if default else "y/N"
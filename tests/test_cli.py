@@ -1,9 +1,30 @@
 """Tests for CLI helper functions."""
 
+import os
+from pathlib import Path
+
 import click
 import pytest
 
-from marx.cli import parse_agent_argument
+from marx import cli as marx_cli
+from marx.cli import (
+    check_dependencies,
+    find_executables,
+    parse_agent_argument,
+    remove_directory_in_background,
+    select_pr_interactive,
+    setup_run_directory,
+    write_placeholder_review,
+)
+from marx.exceptions import DependencyError, MarxError
+from marx.github import GitHubClient
+from marx.review import load_review
+
+
+def _make_executable(directory: Path, name: str) -> None:
+    path = directory / name
+    path.write_text("#!/bin/sh\n", encoding="utf-8")
+    path.chmod(0o755)
 
 
 def test_parse_agent_argument_basic_list() -> None:
@@ -32,6 +53,155 @@ def test_parse_agent_argument_invalid_agent() -> None:
         parse_agent_argument("claude,unknown")
 
 
+def test_parse_agent_argument_reports_all_invalid_agents() -> None:
+    with pytest.raises(click.BadParameter, match=r"Invalid agent\(s\): Unknown, :opus\."):
+        parse_agent_argument("claude,Unknown :opus")
+
+
 def test_parse_agent_argument_missing_model() -> None:
     with pytest.raises(click.BadParameter):
         parse_agent_argument("claude:")
+
+
+def test_find_executables_skips_missing_and_non_executable(monkeypatch, tmp_path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _make_executable(first, "git")
+    _make_executable(second, "gh")
+    (second / "jq").write_text("not executable", encoding="utf-8")
+
+    monkeypatch.setenv(
+        "PATH", os.pathsep.join([str(first), str(tmp_path / "missing"), str(second)])
+    )
+
+    assert find_executables(["git", "gh", "jq"]) == {"git", "gh"}
+
+
+def test_find_executables_lists_each_path_directory_once(monkeypatch, tmp_path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _make_executable(first, "git")
+    _make_executable(second, "gh")
+    _make_executable(second, "jq")
+    monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(second)]))
+
+    listed: list[str] = []
+    real_listdir = os.listdir
+
+    def spy_listdir(path):
+        listed.append(path)
+        return real_listdir(path)
+
+    def fail_which(name, *_args, **_kwargs):  # pragma: no cover - defensive
+        raise AssertionError(f"shutil.which should not be needed for {name}")
+
+    monkeypatch.setattr(os, "listdir", spy_listdir)
+    monkeypatch.setattr(marx_cli.shutil, "which", fail_which)
+
+    assert find_executables(["git", "gh", "jq"]) == {"git", "gh", "jq"}
+    assert listed == [str(first), str(second)]
+
+
+def test_check_dependencies_reports_missing(monkeypatch, tmp_path) -> None:
+    _make_executable(tmp_path, "git")
+    _make_executable(tmp_path, "gh")
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    with pytest.raises(DependencyError, match="jq, docker"):
+        check_dependencies(require_docker=True)
+
+
+def test_select_pr_interactive_returns_head_commit(monkeypatch, sample_pr_data) -> None:
+    class FakeClient:
+        repo = "owner/repo"
+        _extract_reviewer_logins = staticmethod(GitHubClient._extract_reviewer_logins)
+
+        def get_current_user(self) -> str:
+            return "me"
+
+        def list_prs(self, limit: int) -> list[dict]:
+            assert limit == 25
+            return [
+                {
+                    **sample_pr_data,
+                    "reviewRequests": [{"login": "zed"}, {"login": "amy"}],
+                    "reviews": [{"author": {"login": "zed"}}, {"author": {"login": "bob"}}],
+                }
+            ]
+
+        def filter_prs_for_user(self, prs: list[dict], _username: str) -> list[dict]:
+            return prs
+
+        def get_pr(self, _pr_number: int) -> dict:  # pragma: no cover - defensive
+            raise AssertionError("PR details should come from the list response")
+
+    displayed: list[dict] = []
+    monkeypatch.setattr(marx_cli, "display_pr_table", displayed.extend)
+    monkeypatch.setattr(marx_cli, "prompt_for_selection", lambda _max: 1)
+
+    assert select_pr_interactive(FakeClient(), limit=25) == (123, "feature/test", "abc123def456")
+    assert displayed[0]["reviewers"] == "amy, bob, zed"
+
+
+def test_remove_directory_in_background(tmp_path) -> None:
+    run_dir = tmp_path / "pr-1-main"
+    (run_dir / "nested").mkdir(parents=True)
+    (run_dir / "nested" / "claude-review.json").write_text("{}", encoding="utf-8")
+
+    thread = remove_directory_in_background(run_dir)
+
+    assert not run_dir.exists()
+    assert thread is not None
+    thread.join()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_remove_directory_in_background_reports_failures(monkeypatch, tmp_path) -> None:
+    run_dir = tmp_path / "pr-1-main"
+    run_dir.mkdir()
+    (run_dir / "claude-review.json").write_text("{}", encoding="utf-8")
+
+    def failing_unlink(path, *_args, **_kwargs) -> None:
+        raise PermissionError(f"denied: {path}")
+
+    warnings: list[str] = []
+    monkeypatch.setattr(os, "unlink", failing_unlink)
+    monkeypatch.setattr(marx_cli, "print_warning", warnings.append)
+
+    thread = remove_directory_in_background(run_dir)
+    assert thread is not None
+    thread.join()
+
+    assert len(warnings) == 1
+    assert "Could not fully delete" in warnings[0]
+    assert "denied" in warnings[0]
+
+
+def test_setup_run_directory_resume_requires_existing_artifacts(tmp_path) -> None:
+    with pytest.raises(MarxError, match="no artifacts found"):
+        setup_run_directory(tmp_path, 7, "feature/x", resume_mode=True)
+
+    assert (tmp_path / "runs").is_dir()
+
+
+def test_setup_run_directory_creates_sanitized_directory(tmp_path) -> None:
+    run_dir = setup_run_directory(tmp_path, 7, "feature/x", resume_mode=False)
+
+    assert run_dir == tmp_path / "runs" / "pr-7-feature-x"
+    assert run_dir.is_dir()
+
+
+def test_write_placeholder_review_is_loadable(tmp_path) -> None:
+    output_file = tmp_path / "gemini-review.json"
+
+    write_placeholder_review(output_file, 42, "gemini was not selected — skipped")
+
+    review = load_review(output_file)
+    assert review.pr_summary.number == 42
+    assert review.pr_summary.title == "Not run"
+    assert review.pr_summary.description == "gemini was not selected — skipped"
+    assert review.issues == []
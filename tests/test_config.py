@@ -50,6 +50,35 @@ def test_load_environment_does_not_override_existing(monkeypatch, tmp_path) -> N
     assert os.environ["GITHUB_TOKEN"] == "from-env"
 
 
+def test_load_config_file_handles_comments_and_quotes(tmp_path) -> None:
+    """Comments, blank lines, quotes and inline comments should be handled."""
+
+    config_path = _write_config(
+        tmp_path,
+        "# leading comment\r\n"
+        "\r\n"
+        "  MARX_REPO = owner/repo  # inline comment\r\n"
+        "SINGLE='quoted # value'\r\n"
+        "EMPTY=\r\n"
+        "=orphan\r\n"
+        "not a pair\r\n"
+        "URL=https://example.com/?a=b\r\n"
+        "\x0b\x0c\tVERTICAL=x\x0c\x0b\n"
+        "NBSP\xa0=\xa0value\xa0\n",
+    )
+
+    marx_config.clear_config_cache()
+
+    assert marx_config.load_config_file(config_path) == {
+        "MARX_REPO": "owner/repo",
+        "SINGLE": "quoted # value",
+        "EMPTY": "",
+        "URL": "https://example.com/?a=b",
+        "VERTICAL": "x",
+        "NBSP": "value",
+    }
+
+
 def test_load_review_prompt_template_uses_packaged_default(monkeypatch) -> None:
     """The bundled review prompt should be used when no overrides are provided."""
 
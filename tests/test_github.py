@@ -136,3 +136,21 @@ def test_run_gh_command_with_input(monkeypatch: pytest.MonkeyPatch) -> None:
     assert call_kwargs.get("input") == input_json
     assert call_kwargs.get("text") is True
     assert call_kwargs.get("capture_output") is True
+
+
+def test_list_prs_parses_gh_output(monkeypatch) -> None:
+    """list_prs should request head commits and decode non-ASCII titles."""
+
+    calls: list[list[str]] = []
+
+    def fake_run(_self, args, **_kwargs):
+        calls.append(args)
+        return '[{"number": 7, "title": "Fix café → naïve ✨", "headRefOid": "abc"}]', ""
+
+    monkeypatch.setattr(GitHubClient, "_run_gh_command", fake_run)
+
+    prs = GitHubClient(repo="owner/repo").list_prs(limit=5)
+
+    assert prs == [{"number": 7, "title": "Fix café → naïve ✨", "headRefOid": "abc"}]
+    assert "headRefOid" in calls[0][calls[0].index("--json") + 1]
+    assert calls[0][calls[0].index("--limit") + 1] == "5"
@@ -3,9 +3,14 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from marx.review import (
     Issue,
+    MergedReview,
+    PRSummary,
     count_issues_by_priority,
+    create_github_review_payload,
     filter_issues_for_inline_comments,
     load_review,
     merge_reviews,
@@ -47,7 +52,8 @@ def test_count_issues_by_priority() -> None:
         ),
     ]
 
-    p0, p1, p2 = count_issues_by_priority(issues)
+    with pytest.deprecated_call():
+        p0, p1, p2 = count_issues_by_priority(issues)
     assert p0 == 1
     assert p1 == 1
     assert p2 == 1
@@ -207,3 +213,46 @@ def test_merge_reviews(tmp_path: Path) -> None:
     assert len(merged.issues) == 2
     assert merged.issues[0].priority == "P0"
     assert merged.issues[1].priority == "P1"
+    assert [len(merged.issues_by_priority[p]) for p in ("P0", "P1", "P2")] == [1, 1, 0]
+    assert merged.issues_by_priority["P1"] == [merged.issues[1]]
+    assert "issues_by_priority" not in merged.model_dump()
+
+
+def test_merged_review_priorities_derive_from_issues() -> None:
+    """Counts and buckets should follow ``issues`` however the model is built."""
+    critical = Issue(
+        agent="claude",
+        priority="P0",
+        file="test.py",
+        line=1,
+        commit_id="abc123",
+        category="bug",
+        description="Critical bug",
+        proposed_fix="Fix it",
+    )
+    suggestion = critical.model_copy(update={"priority": "P2", "description": "Style"})
+
+    review = MergedReview(
+        descriptions=[],
+        pr_summary=PRSummary(number=1, title="Test PR"),
+        issues=[critical, suggestion],
+    )
+
+    assert review.issues_by_priority == {"P0": [critical], "P1": [], "P2": [suggestion]}
+
+    restored = MergedReview.model_validate(json.loads(review.model_dump_json()))
+    assert [len(restored.issues_by_priority[p]) for p in ("P0", "P1", "P2")] == [1, 0, 1]
+
+    updated = review.model_copy(update={"issues": [suggestion]})
+    assert updated.issues_by_priority == {"P0": [], "P1": [], "P2": [suggestion]}
+
+    class FakeClient:
+        def get_valid_inline_positions(self, _pr_number: int) -> dict[str, list[int]]:
+            return {}
+
+    payload = create_github_review_payload(review, FakeClient(), 1, "abc123")  # type: ignore[arg-type]
+
+    assert "- Critical (P0): 1" in payload["body"]
+    assert "- Important (P1): 0" in payload["body"]
+    assert "- Suggestions (P2): 1" in payload["body"]
+    assert "- Total issues: 2" in payload["body"]
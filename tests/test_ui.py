@@ -0,0 +1,62 @@
+"""Tests for terminal UI rendering."""
+
+import io
+
+from rich.console import Console
+
+from marx import ui
+from marx.review import Issue
+
+
+def _issue(priority: str, description: str) -> Issue:
+    return Issue(
+        agent="claude",
+        priority=priority,
+        file="app.py",
+        line=3,
+        commit_id="abc123",
+        category="bug",
+        description=description,
+        proposed_fix="Fix it",
+    )
+
+
+def test_display_issue_sections_renders_non_empty_sections_in_order(monkeypatch) -> None:
+    """Headers and panels should appear in section order, skipping empty sections."""
+
+    output = io.StringIO()
+    monkeypatch.setattr(ui, "console", Console(file=output, width=80, color_system=None))
+
+    ui.display_issue_sections(
+        [
+            ("P0 - Critical Issues", "🔴", [_issue("P0", "first critical")]),
+            ("P1 - Important Issues", "🟡", []),
+            ("P2 - Suggestions", "🔵", [_issue("P2", "a suggestion")]),
+        ]
+    )
+
+    text = output.getvalue()
+    assert "P1 - Important Issues" not in text
+    positions = [
+        text.index(marker)
+        for marker in (
+            "P0 - Critical Issues",
+            "first critical",
+            "P2 - Suggestions",
+            "a suggestion",
+        )
+    ]
+    assert positions == sorted(positions)
+    assert text.count("╭") == 2
+    assert "📁 app.py:3" in text
+
+
+def test_display_issue_sections_prints_nothing_without_issues(monkeypatch) -> None:
+    """No output should be produced when every section is empty."""
+
+    output = io.StringIO()
+    monkeypatch.setattr(ui, "console", Console(file=output, width=80, color_system=None))
+
+    ui.display_issue_sections([("P0 - Critical Issues", "🔴", [])])
+
+    assert output.getvalue() == ""